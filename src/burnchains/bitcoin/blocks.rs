@@ -378,8 +378,14 @@ impl BitcoinBlockParser {
         let data_amt = tx.output[0].value;
 
         let (opcode, data) = data_opt.unwrap();
-        let inputs_opt = self.parse_inputs(tx);
+
+        // outputs are cheap to check, but every input requires decoding one or more public keys.
+        // don't bother decoding the inputs if the outputs already rule this tx out.
         let outputs_opt = self.parse_outputs(tx);
+        let inputs_opt = match outputs_opt {
+            Some(_) => self.parse_inputs(tx),
+            None => None,
+        };
 
         match (inputs_opt, outputs_opt) {
             (Some(inputs), Some(outputs)) => {
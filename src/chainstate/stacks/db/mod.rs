@@ -28,7 +28,7 @@ use rusqlite::Row;
 use rusqlite::Transaction;
 use rusqlite::NO_PARAMS;
 
-use std::collections::{btree_map::Entry, BTreeMap};
+use std::collections::{btree_map::Entry, BTreeMap, HashMap};
 use std::fmt;
 use std::fs;
 use std::io;
@@ -970,9 +970,21 @@ impl StacksChainState {
                     info!("Initializing chain with lockups");
                     let mut lockups_per_block: BTreeMap<u64, Vec<Value>> = BTreeMap::new();
                     let initial_lockups = get_schedules();
+                    // each address appears once per unlock height, so only decode and
+                    // checksum it the first time we see it.
+                    let mut parsed_addresses: HashMap<String, PrincipalData> = HashMap::new();
                     for schedule in initial_lockups {
-                        let stx_address =
-                            StacksChainState::parse_genesis_address(&schedule.address, mainnet);
+                        let stx_address = match parsed_addresses.get(&schedule.address) {
+                            Some(stx_address) => stx_address.clone(),
+                            None => {
+                                let stx_address = StacksChainState::parse_genesis_address(
+                                    &schedule.address,
+                                    mainnet,
+                                );
+                                parsed_addresses.insert(schedule.address, stx_address.clone());
+                                stx_address
+                            }
+                        };
                         let value = Value::Tuple(
                             TupleData::from_data(vec![
                                 ("recipient".into(), Value::Principal(stx_address)),
@@ -1091,13 +1103,16 @@ impl StacksChainState {
                         .with_clarity_db(|db| {
                             let initial_names = get_names();
                             for entry in initial_names {
-                                let components: Vec<_> =
-                                    entry.fully_qualified_name.split(".").collect();
-                                assert_eq!(components.len(), 2);
+                                let mut components = entry.fully_qualified_name.split(".");
+                                let (name_str, namespace_str) =
+                                    match (components.next(), components.next(), components.next())
+                                    {
+                                        (Some(name), Some(namespace), None) => (name, namespace),
+                                        _ => panic!("Invalid fully qualified name"),
+                                    };
 
                                 let namespace = {
-                                    let namespace_str = components[1];
-                                    if !BNS_CHARS_REGEX.is_match(&namespace_str) {
+                                    if !BNS_CHARS_REGEX.is_match(namespace_str) {
                                         panic!("Invalid namespace characters");
                                     }
                                     let buffer = namespace_str.as_bytes();
@@ -1105,8 +1120,7 @@ impl StacksChainState {
                                 };
 
                                 let name = {
-                                    let name_str = components[0].to_string();
-                                    if !BNS_CHARS_REGEX.is_match(&name_str) {
+                                    if !BNS_CHARS_REGEX.is_match(name_str) {
                                         panic!("Invalid name characters");
                                     }
                                     let buffer = name_str.as_bytes();
@@ -126,12 +126,8 @@ lazy_static! {
         format!(r#"([[:word:]]|[-!?+<>=/*]){{1,{}}}"#, MAX_STRING_LEN);
 }
 
-pub fn lex(input: &str) -> ParseResult<Vec<(LexItem, u32, u32)>> {
-    // Aaron: I'd like these to be static, but that'd require using
-    //    lazy_static (or just hand implementing that), and I'm not convinced
-    //    it's worth either (1) an extern macro, or (2) the complexity of hand implementing.
-
-    let lex_matchers: &[LexMatcher] = &[
+lazy_static! {
+    static ref LEX_MATCHERS: Vec<LexMatcher> = vec![
         LexMatcher::new(
             r##"u"(?P<value>((\\")|([[ -~]&&[^"]]))*)""##,
             TokenType::StringUTF8Literal,
@@ -187,6 +183,10 @@ pub fn lex(input: &str) -> ParseResult<Vec<(LexItem, u32, u32)>> {
             TokenType::Variable,
         ),
     ];
+}
+
+pub fn lex(input: &str) -> ParseResult<Vec<(LexItem, u32, u32)>> {
+    let lex_matchers: &[LexMatcher] = &LEX_MATCHERS;
 
     let mut context = LexContext::ExpectNothing;
 
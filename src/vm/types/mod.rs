@@ -47,6 +47,11 @@ pub const MAX_TYPE_DEPTH: u8 = 32;
 // this is the charged size for wrapped values, i.e., response or optionals
 pub const WRAPPER_VALUE_SIZE: u32 = 1;
 
+lazy_static! {
+    static ref WRAPPED_CODEPOINTS_MATCHER: Regex =
+        Regex::new("^\\\\u\\{(?P<value>[[:xdigit:]]+)\\}").unwrap();
+}
+
 #[derive(Debug, Clone, Eq, Serialize, Deserialize)]
 pub struct TupleData {
     // todo: remove type_signature
@@ -759,13 +764,11 @@ impl Value {
     }
 
     pub fn string_utf8_from_string_utf8_literal(tokenized_str: String) -> Result<Value> {
-        let wrapped_codepoints_matcher =
-            Regex::new("^\\\\u\\{(?P<value>[[:xdigit:]]+)\\}").unwrap();
         let mut window = tokenized_str.as_str();
         let mut cursor = 0;
         let mut data: Vec<Vec<u8>> = vec![];
         while !window.is_empty() {
-            if let Some(captures) = wrapped_codepoints_matcher.captures(window) {
+            if let Some(captures) = WRAPPED_CODEPOINTS_MATCHER.captures(window) {
                 let matched = captures.name("value").unwrap();
                 let scalar_value = window[matched.start()..matched.end()].to_string();
                 let unicode_char = {